@@ -3,9 +3,12 @@ Radarr/Sonarr integration used to pre-seed Kometa artwork before media lands in
 """
 
 import re
+import string
 import time
+import unicodedata
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Iterable, Optional
 
 import requests
 
@@ -15,12 +18,33 @@ from utils.utils import get_path_parts
 
 CACHE_TTL_SECONDS = 60
 REQUEST_TIMEOUT_SECONDS = 10
+NORMALIZED_TITLE_CACHE_SIZE = 4096
 
+# Lowercases A-Z and deletes every other byte outside [a-z0-9]. bytes.translate
+# walks a flat 256-entry table, which is much cheaper than str.translate's
+# per-codepoint dict lookups for the (common) pure-ASCII title.
+_ASCII_LOWER_TABLE = bytes.maketrans(
+    string.ascii_uppercase.encode("ascii"), string.ascii_lowercase.encode("ascii"))
+_ASCII_DELETE_BYTES = bytes(
+    i for i in range(256) if chr(i) not in string.ascii_letters + string.digits)
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
 
+
+@lru_cache(maxsize=NORMALIZED_TITLE_CACHE_SIZE)
 def _normalize_title(title: Optional[str]) -> str:
     if not title:
         return ""
-    return re.sub(r"[^a-z0-9]", "", title.casefold())
+    if title.isascii():
+        return title.encode("ascii").translate(
+            _ASCII_LOWER_TABLE, _ASCII_DELETE_BYTES).decode("ascii")
+    # NFKD splits accented letters into base letter + combining mark, so the regex
+    # keeps "e" from "é" ("Amélie" == "Amelie") instead of dropping the letter
+    return _NON_ALNUM_RE.sub("", unicodedata.normalize("NFKD", title.casefold()))
+
+
+def _normalize_titles(titles: Iterable[Optional[str]]) -> frozenset[str]:
+    """Distinct non-empty normalized forms of titles, i.e. the keys an entry matches on."""
+    return frozenset(_normalize_title(title) for title in titles if title) - {""}
 
 
 def _folder_name(path: Optional[str]) -> Optional[str]:
@@ -28,6 +52,24 @@ def _folder_name(path: Optional[str]) -> Optional[str]:
     return parts[-1] if parts else None
 
 
+@dataclass
+class TitleIndex:
+    """A cached Arr list plus its normalized title -> entries buckets, built once per refresh."""
+    entries: list[dict]
+    buckets: dict[str, list[dict]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, entries: list[dict], titles_for: Callable[[dict], list]) -> "TitleIndex":
+        buckets: dict[str, list[dict]] = {}
+        for entry in entries:
+            for key in _normalize_titles(titles_for(entry)):
+                buckets.setdefault(key, []).append(entry)
+        return cls(entries=entries, buckets=buckets)
+
+    def get(self, normalized_title: str) -> list[dict]:
+        return self.buckets.get(normalized_title, [])
+
+
 @dataclass
 class ArrMovie:
     folder_name: str
@@ -51,7 +93,7 @@ class ArrClient:
     def __init__(self, base_url: Optional[str], api_key: Optional[str]) -> None:
         self.base_url: str = (base_url or "").rstrip("/")
         self.api_key: str = api_key or ""
-        self._cache: Optional[list] = None
+        self._cache: Optional[TitleIndex] = None
         self._cache_time: float = 0.0
 
     @property
@@ -76,14 +118,28 @@ class ArrClient:
                      f"{type(self).__name__}/_get")
             return None
 
-    def _cached_list(self, endpoint: str) -> list:
+    @staticmethod
+    def _entry_titles(entry: dict) -> list:
+        """Titles an entry can be matched by; subclasses add alternates."""
+        return [entry.get("title")]
+
+    def _cached_index(self, endpoint: str) -> TitleIndex:
         now = time.monotonic()
         if self._cache is None or (now - self._cache_time) > CACHE_TTL_SECONDS:
             result = self._get(endpoint)
-            self._cache = result if isinstance(result, list) else []
+            # Normalize the whole list once per refresh rather than on every lookup
+            self._cache = TitleIndex.build(
+                result if isinstance(result, list) else [], self._entry_titles)
             self._cache_time = now
         return self._cache
 
+    def _cached_list(self, endpoint: str) -> list[dict]:
+        return self._cached_index(endpoint).entries
+
+    def _title_matches(self, endpoint: str, normalized_title: str) -> list[dict]:
+        """Cached entries with a title that normalizes to normalized_title, in list order."""
+        return self._cached_index(endpoint).get(normalized_title)
+
     def clear_cache(self) -> None:
         self._cache = None
         self._cache_time = 0.0
@@ -116,10 +172,12 @@ class RadarrClient(ArrClient):
             return None
 
         normalized_title = _normalize_title(title)
+        if not normalized_title:
+            # Nothing left to compare (e.g. punctuation-only or non-Latin titles);
+            # an empty key would match every entry that also normalizes to ""
+            return None
         candidates = []
-        for movie in self._cached_list("movie"):
-            if _normalize_title(movie.get("title")) != normalized_title:
-                continue
+        for movie in self._title_matches("movie", normalized_title):
             movie_year = movie.get("year")
             if year is not None and movie_year is not None and abs(int(movie_year) - int(year)) > 1:
                 continue
@@ -149,6 +207,14 @@ class RadarrClient(ArrClient):
 
 class SonarrClient(ArrClient):
 
+    @staticmethod
+    def _entry_titles(entry: dict) -> list:
+        names = [entry.get("title"), entry.get("sortTitle")]
+        names.extend(
+            alt.get("title") for alt in entry.get("alternateTitles", []) if isinstance(alt, dict)
+        )
+        return names
+
     def find_series(
             self, tmdb_id: Optional[int], title: Optional[str],
             year: Optional[int]) -> Optional[ArrSeries]:
@@ -172,14 +238,12 @@ class SonarrClient(ArrClient):
             return None
 
         normalized_title = _normalize_title(title)
+        if not normalized_title:
+            # Nothing left to compare (e.g. punctuation-only or non-Latin titles);
+            # an empty key would match every entry that also normalizes to ""
+            return None
         candidates = []
-        for series in series_list:
-            names = [series.get("title"), series.get("sortTitle")]
-            names.extend(
-                alt.get("title") for alt in series.get("alternateTitles", []) if isinstance(alt, dict)
-            )
-            if not any(_normalize_title(name) == normalized_title for name in names if name):
-                continue
+        for series in self._title_matches("series", normalized_title):
             series_year = series.get("year")
             if year is not None and series_year is not None and abs(int(series_year) - int(year)) > 1:
                 continue
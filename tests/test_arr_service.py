@@ -1,10 +1,12 @@
+import re
+import unicodedata
 from unittest.mock import MagicMock
 
 import pytest
 import requests
 
 from core.config import Config
-from services.arr_service import ArrService, RadarrClient, SonarrClient
+from services.arr_service import ArrService, RadarrClient, SonarrClient, _normalize_title
 
 pytestmark = pytest.mark.unit
 
@@ -33,6 +35,41 @@ def sonarr():
     return SonarrClient("http://localhost:8989", "sonarr-key")
 
 
+def _reference_normalize(title):
+    return re.sub(r"[^a-z0-9]", "", unicodedata.normalize("NFKD", title.casefold()))
+
+
+class TestNormalizeTitle:
+    # The ASCII bytes.translate fast path must agree with the general Unicode path
+
+    @pytest.mark.parametrize("codepoint", range(128))
+    def test_ascii_fast_path_matches_reference_per_character(self, codepoint):
+        title = f"A{chr(codepoint)}b"
+        assert _normalize_title(title) == _reference_normalize(title)
+
+    @pytest.mark.parametrize("title", [
+        "The Matrix",
+        "Marvel's Agents of S.H.I.E.L.D.",
+        "WALL-E (2008)",
+        "  Mission: Impossible - Dead Reckoning Part One  ",
+        "Se7en",
+    ])
+    def test_ascii_titles_match_reference(self, title):
+        assert _normalize_title(title) == _reference_normalize(title)
+
+    @pytest.mark.parametrize("title, expected", [
+        ("Amélie", "amelie"),
+        ("Pokémon: The First Movie", "pokemonthefirstmovie"),
+        ("Der Große Diktator", "dergrossediktator"),
+    ])
+    def test_non_ascii_titles_fold_to_ascii(self, title, expected):
+        assert _normalize_title(title) == expected
+
+    def test_empty_and_none(self):
+        assert _normalize_title(None) == ""
+        assert _normalize_title("") == ""
+
+
 class TestArrClientConfigured:
 
     def test_not_configured_without_url_or_key(self):
@@ -140,6 +177,25 @@ class TestRadarrFindMovie:
         ])
         assert radarr.find_movie(None, "The Matrix", 1999) is None
 
+    def test_accented_title_matches_ascii_folded_title(self, radarr, mocker):
+        get = mocker.patch("services.arr_service.requests.get")
+        get.return_value = _response([
+            {"title": "Amélie", "year": 2001, "path": "/data/media/movies/Amélie (2001)",
+             "rootFolderPath": "/data/media/movies"},
+        ])
+        result = radarr.find_movie(None, "Amelie", 2001)
+        assert result is not None
+        assert result.folder_name == "Amélie (2001)"
+
+    def test_title_without_alphanumerics_does_not_match(self, radarr, mocker):
+        get = mocker.patch("services.arr_service.requests.get")
+        get.return_value = _response([
+            {"title": "進撃の巨人", "year": 2013, "path": "/data/media/movies/Shingeki (2013)",
+             "rootFolderPath": "/data/media/movies"},
+        ])
+        assert radarr.find_movie(None, "???", 2013) is None
+        get.assert_not_called()
+
     def test_no_title_no_tmdb_id_returns_none(self, radarr, mocker):
         get = mocker.patch("services.arr_service.requests.get")
         assert radarr.find_movie(None, None, 1999) is None
@@ -203,6 +259,17 @@ class TestSonarrFindSeries:
         assert result is not None
         assert result.folder_name == "Foreign (2020)"
 
+    def test_title_and_sort_title_match_counts_once(self, sonarr, mocker):
+        get = mocker.patch("services.arr_service.requests.get")
+        get.return_value = _response([
+            {"title": "The Office", "sortTitle": "office", "year": 2005,
+             "path": "/data/media/tv/The Office (2005)", "rootFolderPath": "/data/media/tv",
+             "seasons": [], "alternateTitles": [{"title": "The Office (US)"}, {"title": "The Office"}]},
+        ])
+        result = sonarr.find_series(None, "The Office", 2005)
+        assert result is not None
+        assert result.folder_name == "The Office (2005)"
+
     def test_ambiguous_title_match_returns_none(self, sonarr, mocker):
         get = mocker.patch("services.arr_service.requests.get")
         get.return_value = _response([